@@ -0,0 +1,64 @@
+"""
+Shared pytest fixtures and configuration for the activities API test suite
+"""
+
+import copy
+import time
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from src.app import activities, app
+
+# Soft per-test wall-clock budget; anything slower usually means a
+# per-test app rebuild or similar regression crept back in
+_TIME_BUDGET_SECONDS = 0.5
+
+
+@pytest.fixture(scope="session")
+async def client():
+    """Create an in-process async client for the app, shared across the session.
+
+    AsyncClient + ASGITransport calls the app directly on the session
+    event loop, avoiding TestClient's per-request portal thread hop;
+    per-test isolation of the activities state is handled separately by
+    reset_activities. The app's lifespan is entered exactly once here,
+    since ASGITransport does not run it on its own.
+    """
+    async with app.router.lifespan_context(app):
+        async with AsyncClient(transport=ASGITransport(app=app),
+                               base_url="http://test") as ac:
+            yield ac
+
+
+@pytest.fixture(scope="session")
+def _pristine_activities():
+    """Snapshot the initial activities state once for the whole session"""
+    return copy.deepcopy(activities)
+
+
+@pytest.fixture
+def reset_activities(_pristine_activities):
+    """Reset activities to known state after each test.
+
+    Yields the pristine snapshot so tests can look up known-good
+    participants without an extra GET round-trip.
+    """
+    yield _pristine_activities
+
+    # Restore each participant list from the session snapshot
+    for activity_name, activity_data in activities.items():
+        activity_data["participants"] = \
+            _pristine_activities[activity_name]["participants"].copy()
+
+
+@pytest.fixture(autouse=True)
+def _time_guard(request):
+    """Warn when a test exceeds the per-test wall-clock budget"""
+    start = time.perf_counter()
+    yield
+    elapsed = time.perf_counter() - start
+    if elapsed > _TIME_BUDGET_SECONDS:
+        request.node.warn(pytest.PytestWarning(
+            f"{request.node.nodeid} took {elapsed:.2f}s "
+            f"(budget {_TIME_BUDGET_SECONDS}s)"
+        ))